@@ -1,7 +1,15 @@
+import asyncio
 import json
 from mangum import Mangum
 from .main import app
 
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    # uvloop não tem suporte no Windows; segue com o loop padrão do asyncio
+    pass
+
 handler = Mangum(app, lifespan="off")
 
 def lambda_handler(event, context):